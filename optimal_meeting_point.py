@@ -8,8 +8,9 @@ that must be located on an empty land cell. If no valid meeting point exists, re
 
 High-level approaches implemented:
 - BFS-per-house (general): For grids that may contain obstacles or values other than 0/1,
-    run a BFS from each house to accumulate distances and reach counts for empty cells.
-    This guarantees correctness in the presence of obstacles but costs O(H * M * N) time.
+    run a BFS from each house to accumulate distances and reach counts for empty cells
+    (or from each candidate empty cell when those are fewer than the houses).
+    This guarantees correctness in the presence of obstacles but costs O(min(H, E) * M * N) time.
 
 - Fast separable path (optimized): For pure 0/1 grids (no obstacles), the Manhattan distance
     cost separates across rows and columns. We compute per-row and per-column costs using
@@ -17,116 +18,248 @@ High-level approaches implemented:
     This removes the H factor and is much faster for dense grids with many houses.
 
 Complexity:
-- General BFS approach: time O(H * M * N), space O(M * N) for distance/reach arrays.
+- General BFS approach: time O(min(H, E) * M * N), space O(M * N) for distance/reach arrays.
 - Optimized separable approach (0/1 grids): time O(M * N) and extra space O(M + N).
 
 Notes:
 - The function returns -1 for invalid inputs (empty grid) or when no empty cell is reachable
     from all houses.
+- Fork safety: with numba installed, BFS workloads of at least _BFS_PARALLEL_MIN_WORK
+    source-cells run on numba's thread pool. Once that pool has started, processes
+    forked from this one hang at exit; use the spawn or forkserver start method
+    when such grids are solved before forking. Smaller BFS runs and the fast path
+    never start it.
 """
 
 from collections import deque
-from typing import List
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+_INT64_MAX = np.iinfo(np.int64).max
+# grids at least this large use the pruned scan; below it a full vectorized scan
+# of the few cells is cheaper than ordering rows and columns
+_PRUNED_MIN_CELLS = 1024
+# upper bound on n_chunks * M * N for the per-thread BFS scratch arrays
+_BFS_SCRATCH_CELLS = 1 << 22
+# BFS workloads (sources x cells) below this stay on the serial kernel; threads
+# do not pay for their start-up and scratch, and the process stays fork-safe
+_BFS_PARALLEL_MIN_WORK = 1 << 20
 
 def min_total_distance(grid: List[List[int]]) -> int:
-    if not grid or not grid[0]:
+    arr = np.asarray(grid, dtype=np.int64)
+    if arr.ndim != 2 or arr.size == 0:
         return -1
-    m, n = len(grid), len(grid[0])
-    total_houses = sum(cell for row in grid for cell in row)
+    m, n = arr.shape
+    total_houses = int(np.count_nonzero(arr == 1))
     if total_houses == 0:
         return -1
-    # collect house coordinates once to avoid scanning multiple times
-    houses = [(i, j) for i in range(m) for j in range(n) if grid[i][j] == 1]
     # Fast path: if grid contains only 0s and 1s (no obstacles),
     # we can compute the total Manhattan distance using separable row/col costs
     # and pick the minimum over empty cells in O(M*N) time.
-    has_only_01 = True
-    for row in grid:
-        for v in row:
-            if v not in (0, 1):
-                has_only_01 = False
-                break
-        if not has_only_01:
-            break
+    has_only_01 = bool(((arr == 0) | (arr == 1)).all())
 
     if has_only_01:
-        # counts per row and per column
-        row_count = [0]*m
-        col_count = [0]*n
-        for i, j in houses:
-            row_count[i] += 1
-            col_count[j] += 1
-
-        # compute cost for each row: cost_row[r] = sum_i row_count[i]*abs(i-r)
-        cost_row = [0]*m
-        # initial cost at row 0
-        cost_row[0] = sum(row_count[i]*i for i in range(m))
-        prefix = 0
-        total = total_houses
-        for r in range(1, m):
-            prefix += row_count[r-1]
-            # moving from r-1 to r changes cost by (2*prefix - total)
-            cost_row[r] = cost_row[r-1] + (2*prefix - total)
-
-        # compute cost for each column similarly
-        cost_col = [0]*n
-        cost_col[0] = sum(col_count[j]*j for j in range(n))
-        prefix = 0
-        for c in range(1, n):
-            prefix += col_count[c-1]
-            cost_col[c] = cost_col[c-1] + (2*prefix - total)
-
-        # now check empty cells only
-        min_cost = float('inf')
-        for i in range(m):
-            for j in range(n):
-                if grid[i][j] == 0:
-                    min_cost = min(min_cost, cost_row[i] + cost_col[j])
-        return min_cost if min_cost != float('inf') else -1
-
-    # General case with obstacles: BFS from each house (original approach)
-    return _bfs_total_distance(grid, houses, m, n, total_houses)
-
-
-def _fast_total_distance(grid: List[List[int]], houses, m: int, n: int, total_houses: int) -> int:
-    """Fast separable path for pure 0/1 grids."""
-    row_count = [0]*m
-    col_count = [0]*n
-    for i, j in houses:
-        row_count[i] += 1
-        col_count[j] += 1
-
-    cost_row = [0]*m
-    cost_row[0] = sum(row_count[i]*i for i in range(m))
-    prefix = 0
-    total = total_houses
-    for r in range(1, m):
-        prefix += row_count[r-1]
-        cost_row[r] = cost_row[r-1] + (2*prefix - total)
-
-    cost_col = [0]*n
-    cost_col[0] = sum(col_count[j]*j for j in range(n))
-    prefix = 0
-    for c in range(1, n):
-        prefix += col_count[c-1]
-        cost_col[c] = cost_col[c-1] + (2*prefix - total)
-
-    min_cost = float('inf')
-    for i in range(m):
-        for j in range(n):
-            if grid[i][j] == 0:
-                min_cost = min(min_cost, cost_row[i] + cost_col[j])
-    return min_cost if min_cost != float('inf') else -1
-
-
-def _bfs_total_distance(grid: List[List[int]], houses, m: int, n: int, total_houses: int) -> int:
-    """BFS-per-house fallback for grids with obstacles."""
+        # values are 0/1, so one int8 copy is lossless and is what the scans take
+        return _fast_total_distance(arr.astype(np.int8), None, m, n, total_houses)
+
+    # General case with obstacles: BFS from houses or candidate empty cells
+    houses = np.argwhere(arr == 1)
+    return _bfs_total_distance(arr, houses, m, n, total_houses)
+
+
+def _fast_total_distance(grid: np.ndarray, houses: Optional[np.ndarray], m: int, n: int,
+                         total_houses: int) -> int:
+    """Fast separable path for pure 0/1 grids.
+
+    grid is an (m, n) array, used without a copy when it is already int8. Costs
+    are derived from the grid alone; houses (None or a (k, 2) array) is accepted
+    for call compatibility with _bfs_total_distance and is not used.
+    """
+    grid_arr = np.asarray(grid, dtype=np.int8)
+    # counts per row and per column
+    row_count = grid_arr.sum(axis=1, dtype=np.int64)
+    col_count = grid_arr.sum(axis=0, dtype=np.int64)
+
+    cost_row = _axis_costs(row_count, total_houses)
+    cost_col = _axis_costs(col_count, total_houses)
+
+    # now check empty cells only
+    if m*n >= _PRUNED_MIN_CELLS:
+        min_cost = _scan_min_pruned(grid_arr, cost_row, cost_col)
+    else:
+        min_cost = _scan_min(grid_arr, cost_row, cost_col)
+    return int(min_cost) if min_cost != _INT64_MAX else -1
+
+
+def _axis_costs(counts, total: int):
+    """cost[r] = sum_i counts[i]*abs(i-r) for every r, from one prefix sum of counts."""
+    # moving from r-1 to r changes the cost by (2*prefix - total) where prefix
+    # counts the houses before r; the deltas are built in the prefix buffer and
+    # slot 0 holds the cost at r=0, so a second in-place cumsum yields all costs
+    delta = np.cumsum(counts)
+    delta[1:] = 2*delta[:-1] - total
+    delta[0] = np.dot(counts, np.arange(len(counts)))
+    return np.cumsum(delta, out=delta)
+
+
+def _scan_min_numpy(grid_arr, cost_row, cost_col) -> int:
+    """Minimum of cost_row[i] + cost_col[j] over empty cells, or _INT64_MAX if none."""
+    mask = grid_arr == 0
+    if not mask.any():
+        return _INT64_MAX
+    costs = cost_row[:, None] + cost_col[None, :]
+    return costs[mask].min()
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _scan_min(grid_arr, cost_row, cost_col):
+        """Compiled equivalent of _scan_min_numpy without the M*N temporaries."""
+        # LLVM vectorizes this int8 loop into branchless selects; a packed uint64
+        # empty-cell bitmask walked with cttz measured 2-7x slower at every density.
+        min_cost = _INT64_MAX
+        for i in range(grid_arr.shape[0]):
+            cr = cost_row[i]
+            row = grid_arr[i]
+            for j in range(grid_arr.shape[1]):
+                if row[j] == 0:
+                    v = cr + cost_col[j]
+                    if v < min_cost:
+                        min_cost = v
+        return min_cost
+
+    @njit(cache=True, boundscheck=False)
+    def _convex_order(costs):
+        """Indices of a convex cost array in ascending cost order, in O(len(costs)).
+
+        The minimum sits at the weighted median; walking outward from it with one
+        pointer per side and always taking the cheaper side yields sorted order.
+        """
+        k = costs.shape[0]
+        order = np.empty(k, dtype=np.int64)
+        left = np.argmin(costs)
+        right = left + 1
+        for t in range(k):
+            if left >= 0 and (right >= k or costs[left] <= costs[right]):
+                order[t] = left
+                left -= 1
+            else:
+                order[t] = right
+                right += 1
+        return order
+
+    @njit(cache=True, boundscheck=False)
+    def _scan_min_pruned(grid_arr, cost_row, cost_col):
+        """_scan_min visiting rows and columns in ascending cost order.
+
+        cost_row and cost_col are convex (sums of weighted |i - r| terms), so both
+        orders come from expanding outward from the median row and column. Within a
+        row the first empty cell in column order is the row's best, and rows stop
+        once even the cheapest column cannot beat the current minimum, so typically
+        only a handful of cells near the median are touched.
+        """
+        row_order = _convex_order(cost_row)
+        col_order = _convex_order(cost_col)
+        min_cost = _INT64_MAX
+        col_min = cost_col[col_order[0]]
+        for i in row_order:
+            cr = cost_row[i]
+            if cr + col_min >= min_cost:
+                break
+            row = grid_arr[i]
+            for j in col_order:
+                v = cr + cost_col[j]
+                if v >= min_cost:
+                    break
+                if row[j] == 0:
+                    min_cost = v
+                    break
+        return min_cost
+
+    # compile up front so the first real call (and benchmark timings) skip the JIT
+    for _kernel in (_scan_min, _scan_min_pruned):
+        _kernel(np.zeros((2, 2), dtype=np.int8), np.zeros(2, dtype=np.int64), np.zeros(2, dtype=np.int64))
+    del _kernel
+else:  # pragma: no cover - exercised only without numba
+    # interpreted pruning loses to the vectorized scan in the worst case
+    _scan_min = _scan_min_pruned = _scan_min_numpy
+
+
+def _bfs_total_distance(grid: np.ndarray, houses: np.ndarray, m: int, n: int, total_houses: int) -> int:
+    """BFS fallback for grids with obstacles.
+
+    grid is an (m, n) array and houses the (k, 2) array of house coordinates.
+
+    A first BFS from one house finds the empty cells in its component; only those
+    can be reached by every house, and if the component misses any other house
+    there is no meeting point at all. Grid distances are symmetric, so the
+    remaining work runs whichever is fewer: a BFS per remaining house onto empty
+    cells, or a BFS per candidate empty cell summing distances to the houses it
+    reaches.
+    """
+    grid_arr = np.ascontiguousarray(grid, dtype=np.int64)
+    house_arr = np.ascontiguousarray(np.asarray(houses, dtype=np.int32).reshape(-1, 2))
+    # one extra O(M*N) pass counting the houses in the first house's component
+    _, houses_reached = _bfs_accumulate(grid_arr, house_arr[:1], 1, True, 1)
+    if houses_reached[house_arr[0, 0], house_arr[0, 1]] < total_houses - 1:
+        return -1
+    dist, reach = _bfs_accumulate(grid_arr, house_arr[:1], 0, False, 1)
+    candidates = reach > 0
+    seeds = np.argwhere(candidates).astype(np.int32)
+    if len(seeds) == 0:
+        return -1
+    if len(seeds) < len(house_arr) - 1:
+        dist, reach = _bfs_accumulate(grid_arr, seeds, 1, True, _bfs_chunks(len(seeds), m, n))
+    elif len(house_arr) > 1:
+        rest_dist, rest_reach = _bfs_accumulate(grid_arr, house_arr[1:], 0, False, _bfs_chunks(len(house_arr) - 1, m, n))
+        dist += rest_dist
+        reach += rest_reach
+    mask = candidates & (reach == total_houses)
+    if not mask.any():
+        return -1
+    return int(dist[mask].min())
+
+
+def _bfs_chunks(n_sources: int, m: int, n: int) -> int:
+    """Number of per-thread chunks to split n_sources BFS runs on an m x n grid into.
+
+    Workloads under _BFS_PARALLEL_MIN_WORK source-cells run as one chunk without
+    asking numba for its thread count: both that query and the parallel kernel
+    start numba's threading layer, after which forked processes hang at exit.
+    Every chunk owns about 28 bytes of scratch per cell (int64 dist/reach, int32
+    visited and queues), so besides the thread and source counts the chunk count
+    is capped to keep the total within _BFS_SCRATCH_CELLS cells (~117 MB);
+    grids larger than that run as a single chunk.
+    """
+    if njit is None or n_sources < 2 or n_sources*m*n < _BFS_PARALLEL_MIN_WORK:
+        return 1
+    return max(1, min(get_num_threads(), n_sources, _BFS_SCRATCH_CELLS // (m*n)))
+
+
+def _bfs_accumulate_py(grid_arr, source_arr, target, into_source, n_chunks=1):
+    """Run a BFS from every source and accumulate distances to cells equal to target.
+
+    With into_source False each reached target cell collects the distance and a
+    reach count from every source; with into_source True each source collects the
+    sum of distances to, and number of, target cells it reaches.
+    n_chunks is accepted for signature parity with the compiled kernel and ignored.
+    """
+    grid = grid_arr.tolist()
+    m, n = grid_arr.shape
     dist = [[0]*n for _ in range(m)]
     reach = [[0]*n for _ in range(m)]
     directions = [(-1,0),(1,0),(0,-1),(0,1)]
     visited_mark = [[0]*n for _ in range(m)]
     visit_id = 1
-    for i, j in houses:
+    # deque of tuples measured faster here than preallocated array('i') or list
+    # queues reused across sources: CPython's index bookkeeping costs more than popleft
+    for i, j in source_arr.tolist():
         q = deque()
         q.append((i, j, 0))
         visited_mark[i][j] = visit_id
@@ -137,15 +270,117 @@ def _bfs_total_distance(grid: List[List[int]], houses, m: int, n: int, total_hou
                 # allow traversal through houses (1) and empty (0); treat 2 as obstacle
                 if 0<=nx<m and 0<=ny<n and visited_mark[nx][ny] != visit_id and grid[nx][ny] != 2:
                     visited_mark[nx][ny] = visit_id
-                    # only accumulate distance/reach for empty land cells
-                    if grid[nx][ny] == 0:
-                        dist[nx][ny] += d+1
-                        reach[nx][ny] += 1
+                    if grid[nx][ny] == target:
+                        ax, ay = (i, j) if into_source else (nx, ny)
+                        dist[ax][ay] += d+1
+                        reach[ax][ay] += 1
                     q.append((nx, ny, d+1))
         visit_id += 1
-    min_dist = float('inf')
-    for i in range(m):
-        for j in range(n):
-            if grid[i][j]==0 and reach[i][j]==total_houses:
-                min_dist = min(min_dist, dist[i][j])
-    return min_dist if min_dist != float('inf') else -1
+    return np.array(dist, dtype=np.int64), np.array(reach, dtype=np.int64)
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _bfs_run(grid_arr, source_arr, start, step, target, into_source, dist, reach, visited, qx, qy):
+        """BFS from sources start, start+step, ... accumulating into dist/reach.
+
+        The queue is a flat buffer of m*n cells since each cell is enqueued at
+        most once per BFS, and distances are tracked per level instead of per cell.
+        """
+        # A uint64 bitset frontier (shift/OR per level) was measured at parity with
+        # this queue: every reached empty cell still needs its own dist/reach update.
+        # Neighbours are visited inline: an inlined helper taking the arrays kept
+        # their refcount updates on every visit and ran ~40x slower outside prange.
+        m, n = grid_arr.shape
+        dxs = (-1, 1, 0, 0)
+        dys = (0, 0, -1, 1)
+        for s in range(start, source_arr.shape[0], step):
+            mark = s + 1
+            sx = source_arr[s, 0]
+            sy = source_arr[s, 1]
+            visited[sx, sy] = mark
+            qx[0] = sx
+            qy[0] = sy
+            # d is the distance of the neighbours of the level being popped
+            head, tail, level_end, d = 0, 1, 1, 1
+            while head < tail:
+                if head == level_end:
+                    level_end = tail
+                    d += 1
+                x = qx[head]
+                y = qy[head]
+                head += 1
+                for k in range(4):
+                    nx = x + dxs[k]
+                    ny = y + dys[k]
+                    # allow traversal through houses (1) and empty (0); treat 2 as obstacle
+                    if nx < 0 or nx >= m or ny < 0 or ny >= n:
+                        continue
+                    if visited[nx, ny] == mark or grid_arr[nx, ny] == 2:
+                        continue
+                    visited[nx, ny] = mark
+                    if grid_arr[nx, ny] == target:
+                        if into_source:
+                            dist[sx, sy] += d
+                            reach[sx, sy] += 1
+                        else:
+                            dist[nx, ny] += d
+                            reach[nx, ny] += 1
+                    qx[tail] = nx
+                    qy[tail] = ny
+                    tail += 1
+
+    @njit(cache=True, boundscheck=False)
+    def _bfs_accumulate_serial(grid_arr, source_arr, target, into_source):
+        m, n = grid_arr.shape
+        dist = np.zeros((m, n), dtype=np.int64)
+        reach = np.zeros((m, n), dtype=np.int64)
+        visited = np.zeros((m, n), dtype=np.int32)
+        qx = np.empty(m*n, dtype=np.int32)
+        qy = np.empty(m*n, dtype=np.int32)
+        _bfs_run(grid_arr, source_arr, 0, 1, target, into_source, dist, reach, visited, qx, qy)
+        return dist, reach
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _bfs_accumulate_parallel(grid_arr, source_arr, target, into_source, n_chunks):
+        m, n = grid_arr.shape
+        dist = np.zeros((n_chunks, m, n), dtype=np.int64)
+        reach = np.zeros((n_chunks, m, n), dtype=np.int64)
+        for c in prange(n_chunks):
+            visited = np.zeros((m, n), dtype=np.int32)
+            qx = np.empty(m*n, dtype=np.int32)
+            qy = np.empty(m*n, dtype=np.int32)
+            _bfs_run(grid_arr, source_arr, c, n_chunks, target, into_source, dist[c], reach[c], visited, qx, qy)
+        return dist.sum(axis=0), reach.sum(axis=0)
+
+    def _bfs_accumulate(grid_arr, source_arr, target, into_source, n_chunks=1):
+        """Compiled _bfs_accumulate_py.
+
+        With n_chunks > 1 sources are split into that many chunks (one per thread,
+        capped by _bfs_chunks so the scratch stays bounded); each chunk owns its
+        visited marks, queue and partial dist/reach arrays, which are summed at the
+        end. A single chunk runs the serial kernel, which never touches numba's
+        threading layer: once that layer has started, forked processes hang at exit.
+        """
+        if n_chunks > 1:
+            return _bfs_accumulate_parallel(grid_arr, source_arr, target, into_source, n_chunks)
+        return _bfs_accumulate_serial(grid_arr, source_arr, target, into_source)
+
+    # No import-time warm-up here: running the parallel kernel starts numba's
+    # threading layer; cache=True keeps the first call cheap after the initial
+    # compile. See _warm_up_bfs.
+else:  # pragma: no cover - exercised only without numba
+    _bfs_accumulate = _bfs_accumulate_py
+
+
+def _warm_up_bfs() -> None:
+    """Compile (or load from cache) the BFS kernels ahead of the first real call.
+
+    Opt-in because the parallel kernel starts numba's threading layer: call it
+    only in processes that will not fork afterwards, e.g. before timing the BFS
+    in a benchmark.
+    """
+    grid_arr = np.zeros((2, 2), dtype=np.int64)
+    source_arr = np.zeros((2, 2), dtype=np.int32)
+    for n_chunks in (1, 2):
+        _bfs_accumulate(grid_arr, source_arr, 0, False, n_chunks)
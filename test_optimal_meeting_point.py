@@ -1,5 +1,19 @@
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
 import unittest
-from optimal_meeting_point import min_total_distance
+from unittest import mock
+
+import numpy as np
+
+import optimal_meeting_point
+from optimal_meeting_point import (
+    min_total_distance, _fast_total_distance, _bfs_total_distance, _axis_costs,
+    _scan_min, _scan_min_pruned, _scan_min_numpy, _INT64_MAX,
+    _bfs_accumulate, _bfs_accumulate_py, _bfs_chunks, _BFS_SCRATCH_CELLS,
+)
 
 class TestOptimalMeetingPoint(unittest.TestCase):
     def test_example(self):
@@ -49,6 +63,14 @@ class TestOptimalMeetingPoint(unittest.TestCase):
         ]
         self.assertEqual(min_total_distance(grid), -1)
 
+    def test_obstacles_not_counted_as_houses(self):
+        grid = [
+            [1, 2, 0],
+            [0, 0, 0],
+            [0, 0, 1]
+        ]
+        self.assertEqual(min_total_distance(grid), 4)
+
     def test_single_house(self):
         grid = [
             [0, 0, 0],
@@ -63,5 +85,132 @@ class TestOptimalMeetingPoint(unittest.TestCase):
         grid[9][9] = 1
         self.assertEqual(min_total_distance(grid), 18)
 
+    def test_fastpath_matches_bfs_random(self):
+        # separable fast path must agree with BFS on obstacle-free grids
+        for seed in range(20):
+            rng = random.Random(seed)
+            m, n = rng.randint(1, 9), rng.randint(1, 9)
+            density = rng.choice([0.1, 0.3, 0.6, 0.9])
+            grid = [[1 if rng.random() < density else 0 for _ in range(n)] for _ in range(m)]
+            houses = [(i, j) for i in range(m) for j in range(n) if grid[i][j] == 1]
+            if not houses:
+                continue
+            self.assertEqual(
+                _fast_total_distance(grid, houses, m, n, len(houses)),
+                _bfs_total_distance(grid, houses, m, n, len(houses)),
+            )
+
+    def test_axis_costs_brute_force(self):
+        rng = np.random.default_rng(4)
+        for k in (1, 2, 9):
+            counts = rng.integers(0, 4, k).astype(np.int64)
+            expected = [sum(counts[i] * abs(i - r) for i in range(k)) for r in range(k)]
+            self.assertEqual(_axis_costs(counts, int(counts.sum())).tolist(), expected)
+
+    def test_scan_kernel_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        for density in (0.0, 0.3, 0.7, 1.0):
+            grid_arr = (rng.random((7, 11)) < density).astype(np.int8)
+            # pruning relies on convex costs, like those of a real grid
+            cost_row = np.abs(np.arange(7) - 3).astype(np.int64) * 5
+            cost_col = (np.arange(11) - 6).astype(np.int64) ** 2
+            expected = _scan_min_numpy(grid_arr, cost_row, cost_col)
+            self.assertEqual(_scan_min(grid_arr, cost_row, cost_col), expected)
+            self.assertEqual(_scan_min_pruned(grid_arr, cost_row, cost_col), expected)
+        full = np.ones((3, 3), dtype=np.int8)
+        self.assertEqual(_scan_min_numpy(full, np.zeros(3, np.int64), np.zeros(3, np.int64)), _INT64_MAX)
+
+    def test_fastpath_matches_bfs_large(self):
+        # large enough for the pruned scan, including a band of houses over the median
+        rng = np.random.default_rng(2)
+        for density in (0.05, 0.5, 0.95):
+            grid = (rng.random((40, 50)) < density).astype(np.int8)
+            grid[18:22, :] = 1
+            houses = np.argwhere(grid == 1)
+            self.assertEqual(
+                _fast_total_distance(grid, houses, 40, 50, len(houses)),
+                _bfs_total_distance(grid, houses, 40, 50, len(houses)),
+            )
+
+    def test_bfs_kernel_matches_python(self):
+        # obstacle grids: compiled BFS must accumulate the same dist/reach as the reference
+        rng = np.random.default_rng(1)
+        for _ in range(10):
+            grid_arr = rng.choice([0, 1, 2], size=(6, 8), p=[0.6, 0.25, 0.15]).astype(np.int64)
+            for source, target in ((1, 0), (0, 1)):
+                source_arr = np.argwhere(grid_arr == source).astype(np.int32)
+                for into_source in (False, True):
+                    ref_dist, ref_reach = _bfs_accumulate_py(grid_arr, source_arr, target, into_source)
+                    for n_chunks in (1, 3):
+                        dist, reach = _bfs_accumulate(grid_arr, source_arr, target, into_source, n_chunks)
+                        np.testing.assert_array_equal(dist, ref_dist)
+                        np.testing.assert_array_equal(reach, ref_reach)
+
+    def test_bfs_seeding_from_empty_cells(self):
+        # few empty cells and many houses: BFS runs from the empty side
+        grid = [
+            [1, 1, 1, 1],
+            [1, 2, 0, 1],
+            [1, 1, 1, 0],
+        ]
+        houses = [(i, j) for i in range(3) for j in range(4) if grid[i][j] == 1]
+        grid_arr = np.array(grid, dtype=np.int64)
+        dist, reach = _bfs_accumulate_py(grid_arr, np.array(houses, dtype=np.int32), 0, False)
+        mask = (grid_arr == 0) & (reach == len(houses))
+        self.assertEqual(_bfs_total_distance(grid, houses, 3, 4, len(houses)), int(dist[mask].min()))
+
+    def test_unreachable_separate_components(self):
+        grid = [
+            [1, 0, 2, 0, 1],
+            [0, 0, 2, 0, 0],
+        ]
+        houses = [(0, 0), (0, 4)]
+        self.assertEqual(_bfs_total_distance(grid, houses, 2, 5, 2), -1)
+
+    def test_separate_components_skip_remaining_bfs(self):
+        # a house outside the first house's component rules out every meeting point,
+        # so the house-counting pass from the first house is the only BFS that runs
+        grid = [
+            [1, 0, 2, 0, 1],
+            [0, 0, 2, 0, 0],
+            [1, 0, 2, 0, 0],
+        ]
+        houses = [(0, 0), (2, 0), (0, 4)]
+        with mock.patch.object(optimal_meeting_point, '_bfs_accumulate',
+                               wraps=optimal_meeting_point._bfs_accumulate) as bfs:
+            self.assertEqual(_bfs_total_distance(grid, houses, 3, 5, 3), -1)
+        self.assertEqual(bfs.call_count, 1)
+
+    def test_bfs_chunks_bounded_by_grid_size(self):
+        self.assertEqual(_bfs_chunks(1, 10, 10), 1)
+        self.assertEqual(_bfs_chunks(6, 3, 5), 1)  # small workloads stay serial
+        side = 2048  # _BFS_SCRATCH_CELLS // side**2 == 1
+        self.assertEqual(_bfs_chunks(1000, side, side), 1)
+        self.assertEqual(_bfs_chunks(1000, 2 * side, 2 * side), 1)
+        for n_sources in (1, 7, 1000):
+            chunks = _bfs_chunks(n_sources, 300, 300)
+            self.assertLessEqual(chunks, n_sources)
+            self.assertLessEqual(chunks * 300 * 300, _BFS_SCRATCH_CELLS)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'needs the fork start method')
+    def test_fork_after_small_bfs_exits(self):
+        # neither the import nor a small BFS (obstacle grid) may start numba's threading
+        # layer, otherwise forked workers finish their tasks but hang at interpreter exit
+        script = (
+            "import multiprocessing\n"
+            "import optimal_meeting_point as omp\n"
+            "grid = [[1, 0, 2, 0, 1], [0, 0, 0, 0, 0], [0, 0, 1, 0, 0]]\n"
+            "assert omp.min_total_distance(grid) == 7\n"
+            "with multiprocessing.get_context('fork').Pool(2) as pool:\n"
+            "    print(pool.map(omp.min_total_distance, [grid] * 4))\n"
+        )
+        try:
+            proc = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                  capture_output=True, text=True, timeout=60)
+        except subprocess.TimeoutExpired:
+            self.fail('process forked after a BFS call did not exit')
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(proc.stdout.strip(), '[7, 7, 7, 7]')
+
 if __name__ == "__main__":
     unittest.main()